@@ -1,7 +1,98 @@
 # INTERFACE LIB
 
 import tkinter as tk
-from tkinter import ttk
+import weakref
+from tkinter import font as tkfont
+
+
+_STYLE_MAP = {"flat": tk.FLAT, "raised": tk.RAISED, "sunken": tk.SUNKEN, "groove": tk.GROOVE, "ridge": tk.RIDGE}
+_SIDE_MAP = {"top": tk.TOP, "bottom": tk.BOTTOM, "left": tk.LEFT, "right": tk.RIGHT}
+
+# Named Tk fonts per interpreter, shared by every widget using the same
+# (family, size, style). The Font objects are kept here because Tk deletes
+# the font when they die; an interpreter's entry goes when its root does.
+_FONT_CACHE = {}
+_FONT_TAG = "InterfaceFontCache"
+
+# Style objects by class and options, so equal styles are created only once.
+_STYLE_CACHE = weakref.WeakValueDictionary()
+
+
+def _named_font(widget, family="Arial", size=10, weight="normal"):
+    tk_app = widget.tk
+    fonts = _FONT_CACHE.get(tk_app)
+    if fonts is None:
+        fonts = _FONT_CACHE[tk_app] = {}
+        # A bindtag only the root carries, so this runs once when the root
+        # goes and not for every child, and user bindings cannot replace it.
+        root = widget._root()
+        root.bindtags((_FONT_TAG,) + root.bindtags())
+        root.bind_class(_FONT_TAG, "<Destroy>", lambda event: _FONT_CACHE.pop(tk_app, None))
+
+    key = (family, size, weight)
+    font = fonts.get(key)
+    if font is None:
+        # Passed as a font description so the last item can hold style
+        # words such as "italic" or "bold underline", not just a weight.
+        font = fonts[key] = tkfont.Font(root=widget, font=key)
+    return font.name
+
+
+class _Deferred:
+    """
+    Callable that runs a handler from the Tk event loop instead of right
+    away, so a burst of fires results in a single run.
+    """
+    __slots__ = ("widget", "handler", "delay", "_after_id")
+
+    def __init__(self, widget, handler, delay):
+        self.widget = widget
+        self.handler = handler
+        self.delay = delay
+        self._after_id = None
+
+    def __call__(self):
+        if self.delay:
+            # Debounce: every fire restarts the timer.
+            if self._after_id is not None:
+                self.widget.after_cancel(self._after_id)
+            self._after_id = self.widget.after(self.delay, self._run)
+        elif self._after_id is None:
+            # Coalesce: fires until the loop goes idle share one run.
+            self._after_id = self.widget.after_idle(self._run)
+
+    def _run(self):
+        self._after_id = None
+        self.handler()
+
+
+class _Batch:
+    """
+    Context manager returned by UIElement.batch(). Nested batches fold
+    into the outer one; only the outermost batch flushes to the widget.
+    """
+    __slots__ = ("element", "_outer")
+
+    def __init__(self, element):
+        self.element = element
+        self._outer = None
+
+    def __enter__(self):
+        element = self.element
+        self._outer = element._pending
+        # Start from the outer buffer so reads inside see its values too.
+        element._pending = {} if self._outer is None else dict(self._outer)
+        return element
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        element = self.element
+        pending, element._pending = element._pending, self._outer
+        if pending and exc_type is None:
+            if self._outer is not None:
+                self._outer.update(pending)
+            else:
+                element._flush(pending)
+        return False
 
 
 # =====================================================
@@ -10,72 +101,201 @@ from tkinter import ttk
 
 class UIElement:
     """Base class for all UI elements."""
+    __slots__ = ("widget", "_pending", "_bg", "_fg", "_has_get", "_tk", "_wpath", "__weakref__")
+
     def __init__(self, widget):
         self.widget = widget
+        self._tk = widget.tk
+        self._wpath = widget._w
+        self._pending = None
+        # Last known colors, so reading them back skips a cget() to Tcl.
+        self._bg = None
+        self._fg = None
+        self._has_get = hasattr(widget, "get")
+
+    # ---------------- Batching ----------------
+
+    def configure(self, **options):
+        """
+        Apply several options to the UI element in a single call.
+        Accepts the raw Tk option names as well as the friendly names
+        background, foreground, font=(family, size, weight),
+        border=(width, style) and padding=(padx, pady).
+        """
+        self._apply(self._normalize(options))
+
+    def batch(self):
+        """
+        Collect every setter call made inside a with-block and apply
+        them to the widget at once when the block ends.
+        """
+        return _Batch(self)
+
+    def _normalize(self, options):
+        if "background" in options:
+            options["bg"] = options.pop("background")
+        if "foreground" in options:
+            options["fg"] = options.pop("foreground")
+        if "border" in options:
+            width, style = options.pop("border")
+            relief = _STYLE_MAP.get(style)
+            if __debug__ and relief is None:
+                raise ValueError("Style must be: flat, raised, sunken, groove, ridge")
+            options["bd"] = width
+            options["relief"] = relief
+        font = options.get("font")
+        if isinstance(font, tuple) and len(font) <= 3:
+            options["font"] = _named_font(self.widget, *font)
+        if "padding" in options:
+            options["padx"], options["pady"] = options.pop("padding")
+        return options
+
+    def _apply(self, options):
+        if self._pending is not None:
+            self._pending.update(options)
+        elif options:
+            self._flush(options)
+
+    def applyStyle(self, style):
+        """Apply a shared Style to the UI element."""
+        self._apply(style._resolve(self))
+
+    def _set(self, option, value):
+        # Single options skip Misc.configure() and its kwargs handling;
+        # option is the Tcl spelling, e.g. "-bg".
+        if self._pending is not None:
+            self._pending[option[1:]] = value
+            return
+        self._tk.call(self._wpath, "configure", option, value)
+        if option == "-bg":
+            self._bg = value
+        elif option == "-fg":
+            self._fg = value
+
+    def _flush(self, options):
+        self.widget.configure(**options)
+        if "bg" in options:
+            self._bg = options["bg"]
+        if "fg" in options:
+            self._fg = options["fg"]
+
+    def _foreground(self):
+        if self._pending and "fg" in self._pending:
+            return self._pending["fg"]
+        if self._fg is None:
+            self._fg = self.widget.cget("fg")
+        return self._fg
+
+    # ---------------- Setters ----------------
 
     def setText(self, text):
         """Set the text of the UI element."""
         if hasattr(self.widget, "config"):
-            self.widget.config(text=text)
+            self._apply({"text": text})
 
     def setSize(self, width=None, height=None):
         """Set the size of the UI element."""
+        options = {}
         if width is not None:
-            self.widget.config(width=width)
+            options["width"] = width
         if height is not None:
-            self.widget.config(height=height)
+            options["height"] = height
+        self._apply(options)
 
     def setBackground(self, color):
         """Set the background color of the UI element."""
-        self.widget.config(bg=color)
+        self._set("-bg", color)
 
     def setForeground(self, color):
         """Set the foreground (text) color of the UI element."""
-        self.widget.config(fg=color)
+        self._set("-fg", color)
 
     def setFont(self, family="Arial", size=10, weight="normal"):
         """Set the font of the UI element."""
-        self.widget.config(font=(family, size, weight))
+        self._apply({"font": _named_font(self.widget, family, size, weight)})
 
     def setPadding(self, padx=0, pady=0):
         """Set internal padding of the UI element."""
         if hasattr(self.widget, "config"):
-            self.widget.config(padx=padx, pady=pady)
+            self._apply({"padx": padx, "pady": pady})
 
     def setBorder(self, width=1, style="flat"):
         """Set border style and width."""
-        style_map = {"flat": tk.FLAT, "raised": tk.RAISED, "sunken": tk.SUNKEN, "groove": tk.GROOVE, "ridge": tk.RIDGE}
-        if style not in style_map:
-            raise ValueError("Style must be: flat, raised, sunken, groove, ridge")
-        self.widget.config(bd=width, relief=style_map[style])
+        self._apply(self._normalize({"border": (width, style)}))
 
     def setCursor(self, cursor_type="arrow"):
         """Set the cursor type when hovering over the element."""
-        self.widget.config(cursor=cursor_type)
+        self._set("-cursor", cursor_type)
 
     def setOpacity(self, alpha=1.0):
         """Set transparency (0.0 to 1.0). Note: Limited support in Tkinter."""
-        if 0.0 <= alpha <= 1.0:
-            self.widget.config(activeforeground=self.widget.cget("fg"))
-        else:
+        if __debug__ and not 0.0 <= alpha <= 1.0:
             raise ValueError("Alpha must be between 0.0 and 1.0")
+        self._apply({"activeforeground": self._foreground()})
 
-    def event(self, *functions):
+    def event(self, *functions, debounce_ms=0, coalesce=False):
         """
         Attach multiple functions to the component.
         Each function is executed in order when the event fires.
+        With coalesce=True, fires that arrive before the window is idle
+        run the functions once. With debounce_ms, they run once the event
+        has stopped firing for that many milliseconds. Use only one of the two.
         """
-        def combined():
-            for fn in functions:
-                fn()
-        self.widget.config(command=combined)
+        if debounce_ms and coalesce:
+            raise ValueError("Use either debounce_ms or coalesce, not both")
+        if len(functions) == 1:
+            command = functions[0]
+        else:
+            def command():
+                for fn in functions:
+                    fn()
+        if debounce_ms or coalesce:
+            command = _Deferred(self.widget, command, debounce_ms)
+        self._apply({"command": command})
 
     def get(self):
         """Get the current value of the UI element."""
+        return self.widget.get() if self._has_get else None
+
+
+# =====================================================
+# Styles
+# =====================================================
+
+class Style:
+    """
+    A reusable set of options that can be applied to many UI elements.
+    Takes the same options as UIElement.configure(); equal styles are
+    shared and their options are only converted once.
+    """
+    __slots__ = ("_kw", "_options", "_tk", "__weakref__")
+
+    def __new__(cls, **options):
         try:
-            return self.widget.get()
-        except:
-            return None
+            key = (cls, frozenset(options.items()))
+        except TypeError:
+            key = None
+        else:
+            style = _STYLE_CACHE.get(key)
+            if style is not None:
+                return style
+
+        style = super().__new__(cls)
+        style._kw = options
+        style._options = None
+        style._tk = None
+        if key is not None:
+            _STYLE_CACHE[key] = style
+        return style
+
+    def _resolve(self, element):
+        # Named fonts belong to one interpreter, so convert again if the
+        # style is used with widgets from another one.
+        tk_app = element.widget.tk
+        if self._tk is not tk_app:
+            self._options = element._normalize(dict(self._kw))
+            self._tk = tk_app
+        return self._options
 
 
 # =====================================================
@@ -84,18 +304,24 @@ class UIElement:
 
 class Button(UIElement):
     """A clickable button."""
+    __slots__ = ()
+
     def __init__(self, text=""):
         super().__init__(tk.Button(text=text))
 
 
 class Label(UIElement):
     """A text label."""
+    __slots__ = ()
+
     def __init__(self, text=""):
         super().__init__(tk.Label(text=text))
 
 
 class TextInput(UIElement):
     """A single-line text input field."""
+    __slots__ = ()
+
     def __init__(self, width=20):
         super().__init__(tk.Entry(width=width))
 
@@ -109,9 +335,15 @@ class TextInput(UIElement):
 
 class FrameBox(UIElement):
     """A container that can hold other UI elements."""
+    __slots__ = ()
+
     def __init__(self):
-        self.frame = tk.Frame()
-        super().__init__(self.frame)
+        super().__init__(tk.Frame())
+
+    @property
+    def frame(self):
+        """The underlying Tk frame (same object as widget)."""
+        return self.widget
 
     def add(self, element, **opts):
         # default pack
@@ -124,13 +356,39 @@ class FrameBox(UIElement):
 
 class Interface:
     """Main interface window."""
+    __slots__ = ("_root", "_layout", "_pack_side", "_add_impl", "__weakref__")
+
+    # Layout name -> method that adds an element with that layout manager.
+    _ADD_METHODS = {"pack": "_add_pack", "grid": "_add_grid", "place": "_add_place"}
+
     def __init__(self):
-        self.root = tk.Tk()
+        self._root = None
         self._layout = None
         self._pack_side = tk.TOP
+        self._add_impl = self._add_unset
 
     # ---------------- Window ----------------
 
+    @property
+    def root(self):
+        """
+        The Tk window, created the first time it is needed. All Interface
+        objects share Tkinter's default root, so they control one window.
+        """
+        if self._root is None:
+            # Widgets created before the window make Tkinter start its own
+            # default root; reuse it so they show up inside this window.
+            # _default_root is private and gone after tk.NoDefaultRoot().
+            root = getattr(tk, "_default_root", None)
+            if root is None:
+                root = tk.Tk()
+            self._root = root
+        return self._root
+
+    @root.setter
+    def root(self, root):
+        self._root = root
+
     def setTitle(self, title: str):
         """Set the window title."""
         self.root.title(title)
@@ -155,40 +413,75 @@ class Interface:
 
     def setLayout(self, layout: str):
         """Set the layout manager for the interface."""
-        if layout not in ("pack", "grid", "place"):
+        method = self._ADD_METHODS.get(layout)
+        if __debug__ and method is None:
             raise ValueError("Layout must be: pack, grid, or place")
+        # Under -O an unknown layout leaves add() raising "Layout not set!".
+        self._add_impl = getattr(self, method or "_add_unset")
         self._layout = layout
 
     def setPackSide(self, side: str):
         """Set the side for pack layout."""
-        side_map = {
-            "top": tk.TOP,
-            "bottom": tk.BOTTOM,
-            "left": tk.LEFT,
-            "right": tk.RIGHT
-        }
-        if side not in side_map:
+        pack_side = _SIDE_MAP.get(side)
+        if __debug__ and pack_side is None:
             raise ValueError("Side must be: top, bottom, left, right")
 
-        self._pack_side = side_map[side]
+        self._pack_side = pack_side
 
     # ---------------- Add Widgets ----------------
 
     def add(self, element: UIElement, **options):
         """Add a UI element to the interface with the specified layout."""
-        widget = element.widget
-
-        if self._layout == "pack":
-            widget.pack(side=self._pack_side)
-        elif self._layout == "grid":
-            widget.grid(row=options.get("row", 0), column=options.get("column", 0))
-        elif self._layout == "place":
-            widget.place(x=options.get("x", 0), y=options.get("y", 0))
-        else:
-            raise RuntimeError("Layout not set! Use setLayout().")
+        self._add_impl(element, options)
+
+    def addAt(self, element: UIElement, row: int = 0, column: int = 0):
+        """Add a UI element to the grid at the given row and column."""
+        element._tk.call("grid", "configure", element._wpath, "-row", row, "-column", column)
+
+    def addXY(self, element: UIElement, x: int = 0, y: int = 0):
+        """Add a UI element placed at the given x and y position."""
+        element._tk.call("place", "configure", element._wpath, "-x", x, "-y", y)
+
+    def _add_pack(self, element, options):
+        # Straight to Tcl, skipping Pack.pack_configure()'s option handling.
+        element._tk.call("pack", "configure", element._wpath, "-side", self._pack_side)
+
+    def _add_grid(self, element, options):
+        self.addAt(element, options.get("row", 0), options.get("column", 0))
+
+    def _add_place(self, element, options):
+        self.addXY(element, options.get("x", 0), options.get("y", 0))
+
+    def _add_unset(self, element, options):
+        raise RuntimeError("Layout not set! Use setLayout().")
 
     # ---------------- Show Window ----------------
 
     def show(self):
         """Display the interface window."""
         self.root.mainloop()
+
+    def pump(self):
+        """
+        Process all pending window events and return without blocking.
+        Use this instead of show() to drive the window from your own loop.
+        """
+        dooneevent = self.root.tk.dooneevent
+        while dooneevent(tk._tkinter.DONT_WAIT):
+            pass
+
+    async def run_async(self, interval=0.01):
+        """
+        Run the window inside an asyncio event loop until it is closed,
+        processing its events every interval seconds.
+        """
+        import asyncio
+
+        root = self.root
+        try:
+            while root.winfo_exists():
+                self.pump()
+                await asyncio.sleep(interval)
+        except tk.TclError:
+            # The window was destroyed while its events were processed.
+            pass